@@ -1,16 +1,283 @@
 #!/usr/bin/env python3
 import argparse
 import asyncio
+import hashlib
+import html
+import json
+import logging
 import os
+import re
+import shutil
+import sys
+import time
+from collections import defaultdict
+from concurrent.futures import ThreadPoolExecutor
+from io import BytesIO
 from pathlib import Path
+from urllib.parse import urlparse
 from playwright.async_api import async_playwright
-from PyPDF2 import PdfWriter, PdfReader
+
+try:
+    import pikepdf
+except ImportError:  # Fall back to the slower pure-Python merger
+    pikepdf = None
+    import pypdf
+
+try:
+    import resource
+except ImportError:  # Not available on Windows
+    resource = None
 
 from site_handlers import get_handler, list_available_sites
 
+# Third-party analytics/ad hosts (and their subdomains) that never contribute
+# to the rendered docs; matched against the request's hostname only
+BLOCKED_HOSTS_RE = re.compile(
+    r'(^|\.)(google-analytics\.com|googletagmanager\.com|doubleclick\.net|segment\.(io|com)|hotjar\.com)$'
+)
+
+TOC_PDF_FILENAME = "000_table_of_contents.pdf"
+
+# Chromium features that headless PDF rendering never uses
+CHROMIUM_ARGS = [
+    "--disable-dev-shm-usage",
+    "--disable-gpu",
+    "--disable-extensions",
+    "--disable-background-networking",
+    "--disable-default-apps",
+    "--disable-translate",
+    "--disable-sync",
+    "--metrics-recording-only",
+    "--no-first-run",
+    "--mute-audio",
+    "--disable-features=TranslateUI,BackForwardCache,MediaRouter",
+]
+
+# page.goto timeout in milliseconds
+NAVIGATION_TIMEOUT = 30000
+
+# Resolves once fonts have loaded and a full layout pass has completed
+READY_JS = "Promise.all([document.fonts.ready, new Promise(r => requestAnimationFrame(() => requestAnimationFrame(r)))])"
+READY_TIMEOUT = 5  # seconds
+
+# Write buffer for the merged PDF
+MERGED_PDF_BUFFER_SIZE = 4 * 1024 * 1024
+
+# Registered once per context; builds the title block at the top of each
+# article from doc values set as text, so titles never need escaping
+TITLE_PAGE_JS = """
+window.__injectTitle = ({ number, title, url }) => {
+    const titleDiv = document.createElement('div');
+    titleDiv.style.cssText = `
+        text-align: center;
+        padding: 50px 20px 20px 20px;
+        font-family: -apple-system, BlinkMacSystemFont, 'Segoe UI', Roboto, sans-serif;
+        border-bottom: 2px solid #0066cc;
+        margin-bottom: 30px;
+    `;
+    
+    const heading = document.createElement('h1');
+    heading.style.cssText = 'color: #0066cc; margin: 0; font-size: 2.5em;';
+    heading.textContent = `${number}. ${title}`;
+    
+    const link = document.createElement('p');
+    link.style.cssText = 'color: #666; margin: 10px 0 0 0; font-size: 1.1em;';
+    link.textContent = url;
+    
+    titleDiv.append(heading, link);
+    
+    const article = document.querySelector('article');
+    if (article) {
+        article.insertBefore(titleDiv, article.firstChild);
+    }
+};
+"""
+
+# Appends the site-specific CSS overrides (a JSON string literal) to each page.
+# As part of the init script the stylesheet crosses the driver once per pooled
+# page, and inlining it means printing never waits on a stylesheet request
+CSS_OVERRIDES_JS = """
+document.addEventListener('DOMContentLoaded', () => {
+    const style = document.createElement('style');
+    style.textContent = %s;
+    document.head.appendChild(style);
+});
+"""
+
+# Static head of the table of contents page; only the title varies per run
+TOC_HEADER_TEMPLATE = """
+<!DOCTYPE html>
+<html>
+<head>
+    <meta charset="utf-8">
+    <title>{toc_title} - Table of Contents</title>
+    <style>
+        body {{
+            font-family: -apple-system, BlinkMacSystemFont, 'Segoe UI', Roboto, sans-serif;
+            line-height: 1.6;
+            max-width: 800px;
+            margin: 0 auto;
+            padding: 40px 20px;
+            color: #333;
+        }}
+        
+        .header {{
+            text-align: center;
+            margin-bottom: 50px;
+            border-bottom: 3px solid #0066cc;
+            padding-bottom: 30px;
+        }}
+        
+        .header h1 {{
+            color: #0066cc;
+            font-size: 3em;
+            margin: 0;
+            font-weight: 300;
+        }}
+        
+        .header p {{
+            color: #666;
+            font-size: 1.2em;
+            margin: 20px 0 0 0;
+        }}
+        
+        .section-header {{
+            background: linear-gradient(135deg, #0066cc, #004499);
+            color: white;
+            padding: 15px 20px;
+            margin: 30px 0 10px 0;
+            border-radius: 8px;
+            font-size: 1.3em;
+            font-weight: 600;
+            text-transform: uppercase;
+            letter-spacing: 1px;
+            page-break-inside: avoid;
+            page-break-after: avoid;
+        }}
+        
+        .section-header:first-of-type {{
+            margin-top: 0;
+        }}
+        
+        .toc-entry {{
+            display: flex;
+            justify-content: space-between;
+            align-items: center;
+            padding: 12px 20px;
+            margin: 2px 0;
+            border-left: 4px solid #e3f2fd;
+            background-color: #fafafa;
+            border-radius: 0 6px 6px 0;
+            page-break-inside: avoid;
+            transition: all 0.2s ease;
+        }}
+        
+        .toc-entry:hover {{
+            background-color: #e3f2fd;
+            border-left-color: #0066cc;
+        }}
+        
+        .toc-title {{
+            flex-grow: 1;
+            font-weight: 500;
+            color: #0066cc;
+            font-size: 1.05em;
+        }}
+        
+        .toc-page {{
+            font-weight: bold;
+            color: #666;
+            margin-left: 20px;
+            background-color: #0066cc;
+            color: white;
+            padding: 4px 8px;
+            border-radius: 12px;
+            font-size: 0.9em;
+        }}
+        
+        .toc-url {{
+            font-size: 0.8em;
+            color: #999;
+            font-style: italic;
+            margin-top: 4px;
+            opacity: 0.8;
+        }}
+        
+        .generation-info {{
+            margin-top: 50px;
+            padding-top: 30px;
+            border-top: 1px solid #eee;
+            font-size: 0.9em;
+            color: #666;
+            text-align: center;
+        }}
+        
+        .section-summary {{
+            background-color: #f8f9fa;
+            padding: 15px;
+            border-radius: 6px;
+            margin: 20px 0;
+            border-left: 4px solid #0066cc;
+        }}
+    </style>
+</head>
+<body>
+    <div class="header">
+        <h1>{toc_title}</h1>
+        <p>Complete Documentation Guide</p>
+    </div>
+    
+    <div class="toc">
+"""
+
+# Repeated parts of the table of contents page, filled in once per section and entry
+TOC_SECTION_TEMPLATE = """
+                    <div class="section-header">{section}</div>
+"""
+
+TOC_ENTRY_TEMPLATE = """
+                        <div class="toc-entry">
+                            <div>
+                                <div class="toc-title">{number}. {title}</div>
+                                <div class="toc-url">{url}</div>
+                            </div>
+                        </div>
+"""
+
+
+def new_pdf_writer():
+    """Create an empty PDF to merge pages into"""
+    return pikepdf.Pdf.new() if pikepdf else pypdf.PdfWriter()
+
+
+def open_pdf(pdf_data):
+    """Open a PDF from its bytes"""
+    return pikepdf.Pdf.open(BytesIO(pdf_data)) if pikepdf else pypdf.PdfReader(BytesIO(pdf_data))
+
+
+def close_pdf(pdf):
+    """Release a PDF opened by open_pdf; pypdf readers hold nothing beyond their bytes"""
+    if pikepdf:
+        pdf.close()
+
+
+def peak_rss_mb():
+    """Peak resident set size of this process in MB, if it can be measured"""
+    if resource is None:
+        return None
+    peak = resource.getrusage(resource.RUSAGE_SELF).ru_maxrss
+    # ru_maxrss is reported in bytes on macOS and in kilobytes elsewhere
+    return peak / (1024 * 1024) if sys.platform == 'darwin' else peak / 1024
+
 
 class DocumentationScraper:
-    """Generic documentation scraper that works with multiple sites"""
+    """
+    Generic documentation scraper that works with multiple sites
+    
+    Pages are long-lived: the pool's pages share one browser context
+    for the whole run, and everything that renders (docs and the TOC) borrows
+    one from the pool rather than opening its own.
+    """
     
     def __init__(self, site_handler, output_dir=None):
         self.site_handler = site_handler
@@ -28,47 +295,140 @@ class DocumentationScraper:
         
         self.doc_metadata = []
         self.cached = False
+        self.max_age = None
+        self.concurrency = 1
+        self.pdf_concurrency = 4
+        self.write_batch = 8
+        self.keep_individual = False
+        self.force_index = False
+        self.block_assets = True
+        self.clear_cache = False
+        self.browser_profile_dir = self.output_dir / ".pw-cache"
+        self.url_index_path = self.output_dir / ".url_index.json"
+        self.resume = False
+        self.completed_docs = set()
+        self.docs_manifest_path = self.output_dir / "docs.ndjson"
+        
+        # PDFs rendered in memory, keyed by pdf_filename until the merger takes them
+        self.pdf_data = {}
+        
+        # Hashes of cached PDFs checked this run, so the merger needn't reread unchanged ones
+        self.verified_sha1 = {}
+        
+        # Page ranges, bookmarks and open source PDFs of the merge in progress,
+        # plus the previous run's merged PDF and page ranges
+        self.merge_manifest = []
+        self.merge_outline = []
+        self.merge_sources = []
+        self.previous_merge = None
+        self.previous_manifest = {}
+        self.blocked_resource_types = set(site_handler.get_blocked_resource_types())
+        
+        # Init script shared by all printing contexts, built once per run
+        self.print_init_script = TITLE_PAGE_JS
+        if hasattr(site_handler, 'get_css_overrides'):
+            self.print_init_script += CSS_OVERRIDES_JS % json.dumps(site_handler.get_css_overrides())
+        
+        # (merge position, doc or None if it produced no PDF), terminated by None
+        self.merge_queue = asyncio.Queue()
+        
+        # ([(path, bytes), ...], future resolved once written), terminated by None
+        self.write_queue = asyncio.Queue()
 
     async def scrape_all_docs(self):
         print(f"Starting {self.config['site_name']} Documentation Scraping...")
         print(f"Output directory: {self.output_dir.absolute()}")
         
         async with async_playwright() as p:
-            # Launch browser
-            browser = await p.chromium.launch(headless=True)
-            context = await browser.new_context()
-            page = await context.new_page()
+            context = await self.launch_context(p)
+            initial_pages = list(context.pages)
             
             # Set longer timeouts to handle slow connections
-            page.set_default_timeout(120000)  # 2 minutes for all operations
+            context.set_default_timeout(120000)  # 2 minutes for all operations
+            
+            # Skip downloading resources that don't affect the PDF output
+            if self.block_assets:
+                await context.route("**/*", self.block_resources)
             
-            # Get all documentation URLs using the site handler
-            all_docs = await self.site_handler.get_all_doc_urls(page)
+            # Warm pool of pre-configured pages for the workers
+            self.page_pool = asyncio.Queue()
+            for page in await asyncio.gather(*(
+                self.create_page(context) for _ in range(max(1, self.concurrency))
+            )):
+                self.page_pool.put_nowait(page)
+            
+            # Every page is opened explicitly, so drop the blank one the profile starts with
+            for page in initial_pages:
+                await page.close()
+            
+            # Reuse the previous run's URL index when every PDF it lists is cached;
+            # otherwise get all documentation URLs using the site handler, on a
+            # page without the print CSS since that hides the navigation it reads
+            all_docs = self.load_url_index() if self.cached and not self.force_index else None
+            if all_docs is None:
+                all_docs = await self.site_handler.run_with_context(context)
+                if all_docs:
+                    self.save_url_index(all_docs)
 
             if not all_docs:
                 print("No URLs found. Exiting...")
-                await browser.close()
+                await self.close_context(context)
                 return
             
-            self.doc_metadata = all_docs
+            self.doc_metadata = list(all_docs)
             
-            print(f"\nStarting to scrape {len(all_docs)} pages...")
+            # Write and merge PDFs in the background while the remaining pages render
+            write_task = asyncio.create_task(self.write_worker())
+            merge_task = asyncio.create_task(self.merge_worker())
             
-            successful = 0
-            failed = 0
+            # Navigation runs on every worker, but PDF emission (the TOC's included)
+            # shares the single CDP pipe
+            self.pdf_semaphore = asyncio.Semaphore(max(1, self.pdf_concurrency))
             
-            for i, doc in enumerate(all_docs, 1):
-                print(f"\n[{i}/{len(all_docs)}] Processing: {doc['url']}")
-                
-                if await self.save_page_as_pdf(page, doc, i-1):
-                    successful += 1
-                else:
-                    failed += 1
+            # The TOC only depends on the discovered docs, so render it alongside the pages
+            toc_task = asyncio.create_task(self.queue_toc_pdf())
             
-            # Create table of contents
-            await self.create_toc_pdf(browser)
+            try:
+                print(f"\nStarting to scrape {len(all_docs)} pages...")
+                
+                # Fan the docs out to a pool of workers sharing the warm pages
+                queue = asyncio.Queue()
+                for i, doc in enumerate(all_docs):
+                    queue.put_nowait((i, doc))
+                
+                # Record each scraped doc as it completes, so an interrupted run can be
+                # resumed; a resumed run keeps the existing records and adds to them
+                self.completed_docs = self.load_completed_docs() if self.resume else set()
+                manifest_mode = "a" if self.resume else "w"
+                with self.docs_manifest_path.open(manifest_mode, encoding="utf-8") as self.docs_manifest:
+                    # Pages only ever run as many at a time as there are workers, and the merger
+                    # restores document order; a worker that crashes cancels the others
+                    worker_count = max(1, min(self.concurrency, len(all_docs)))
+                    async with asyncio.TaskGroup() as workers:
+                        tasks = [
+                            workers.create_task(self.scrape_worker(queue, len(all_docs)))
+                            for _ in range(worker_count)
+                        ]
+                results = [task.result() for task in tasks]
+                
+                successful = sum(worker_successful for worker_successful, _ in results)
+                failed = sum(worker_failed for _, worker_failed in results)
+                
+                await toc_task
+                
+                await self.write_queue.put(None)
+                await write_task
+            except BaseException:
+                # Don't leave the TOC, writer and merger running (or merge a partial
+                # document) when the scrape fails or is interrupted
+                background = (toc_task, write_task, merge_task)
+                for task in background:
+                    task.cancel()
+                await asyncio.gather(*background, return_exceptions=True)
+                await self.close_context(context)
+                raise
             
-            await browser.close()
+            await self.close_context(context)
             
             print(f"\n{'='*50}")
             print(f"Scraping completed!")
@@ -76,26 +436,165 @@ class DocumentationScraper:
             print(f"Failed: {failed}")
             print(f"Total: {len(all_docs)}")
             
-            # Merge all PDFs into one
-            merged_pdf = self.merge_pdfs()
+            # Wait for the background merge to finish
+            await self.merge_queue.put(None)
+            merged_pdf = await merge_task
             
             if merged_pdf:
                 print(f"\n🎉 Complete documentation available at: {merged_pdf}")
     
+    async def launch_context(self, playwright):
+        """Launch the browser and the one context all pages share"""
+        launch_options = dict(
+            headless=True,
+            args=CHROMIUM_ARGS,
+            ignore_default_args=["--enable-automation"],
+        )
+        
+        # Request routing turns Chromium's HTTP cache off, so a persistent profile
+        # would only carry cookies between runs; use a throwaway context instead
+        if self.block_assets:
+            browser = await playwright.chromium.launch(**launch_options)
+            return await browser.new_context()
+        
+        # Otherwise keep the profile in the output directory, so the HTTP cache
+        # carries over between pages and between runs
+        if self.clear_cache:
+            shutil.rmtree(self.browser_profile_dir, ignore_errors=True)
+        return await playwright.chromium.launch_persistent_context(
+            str(self.browser_profile_dir), **launch_options
+        )
+    
+    async def close_context(self, context):
+        """Close the shared context and the browser it was launched in"""
+        browser = context.browser
+        await context.close()
+        if browser is not None:
+            await browser.close()
+    
+    def load_completed_docs(self):
+        """(url, pdf_filename) of docs recorded as done whose PDFs still match their metadata"""
+        completed = set()
+        try:
+            with self.docs_manifest_path.open(encoding="utf-8") as f:
+                for line in f:
+                    try:
+                        doc = json.loads(line)
+                    except ValueError:
+                        continue  # A record cut short when the run was interrupted
+                    # Only trust a PDF this URL rendered, and that hasn't changed since
+                    pdf_path = self.individual_pdfs_dir / doc['pdf_filename']
+                    meta = self.read_cache_meta(doc, pdf_path)
+                    if meta is not None and self.verify_pdf(pdf_path, meta):
+                        completed.add((doc['url'], doc['pdf_filename']))
+        except OSError:
+            pass
+        
+        if completed:
+            print(f"Resuming: {len(completed)} docs already finished")
+        return completed
+    
+    def load_url_index(self):
+        """Load the docs saved by the previous discovery, if all their PDFs are cached"""
+        try:
+            index = json.loads(self.url_index_path.read_text(encoding="utf-8"))
+        except (OSError, ValueError):
+            return None
+        
+        docs = index.get('docs')
+        if not docs or not all((self.individual_pdfs_dir / doc['pdf_filename']).exists() for doc in docs):
+            return None
+        
+        # Restore the handler state discovery would have built
+        self.site_handler.restore_state(index.get('sections', []), docs)
+        print(f"Loaded {len(docs)} documentation URLs from {self.url_index_path.name}")
+        return docs
+    
+    def save_url_index(self, docs):
+        """Save the discovered docs so later --cached runs can skip discovery"""
+        index = {'sections': list(self.site_handler.sections), 'docs': docs}
+        tmp_path = self.url_index_path.with_name(self.url_index_path.name + ".tmp")
+        tmp_path.write_text(json.dumps(index, indent=2), encoding="utf-8")
+        os.replace(tmp_path, self.url_index_path)
+    
+    async def create_page(self, context):
+        """Create a page ready to print docs on"""
+        page = await context.new_page()
+        
+        # Register the title builder and CSS overrides once so every page load picks them up
+        await page.add_init_script(self.print_init_script)
+        return page
+    
+    async def block_resources(self, route):
+        """Abort requests for blocked resource types and tracker hosts"""
+        request = route.request
+        hostname = urlparse(request.url).hostname or ''
+        if request.resource_type in self.blocked_resource_types or BLOCKED_HOSTS_RE.search(hostname):
+            await route.abort()
+        else:
+            await route.continue_()
+    
+    async def scrape_worker(self, queue, total):
+        """Process queued docs on pooled pages until the queue is drained"""
+        successful = 0
+        failed = 0
+        
+        while True:
+            try:
+                index, doc = queue.get_nowait()
+            except asyncio.QueueEmpty:
+                break
+            
+            print(f"\n[{index + 1}/{total}] Processing: {doc['url']}")
+            
+            # Docs an interrupted run already finished are merged from their saved PDF
+            if (doc['url'], doc['pdf_filename']) in self.completed_docs:
+                print("Already finished by the interrupted run")
+                successful += 1
+                await self.merge_queue.put((index + 1, doc))
+                continue
+            
+            page = await self.page_pool.get()
+            try:
+                saved = await self.save_page_as_pdf(page, doc, index)
+            finally:
+                self.page_pool.put_nowait(page)
+            
+            if saved:
+                successful += 1
+                await self.merge_queue.put((index + 1, doc))
+            else:
+                failed += 1
+                await self.merge_queue.put((index + 1, None))
+        
+        return successful, failed
+    
     async def save_page_as_pdf(self, page, doc, index):
         """Save a single page as PDF"""
         try:
-            if self.cached and os.path.exists(self.individual_pdfs_dir / doc['pdf_filename']):
-                print("Found in cache")
-                return True
+            pdf_path = self.individual_pdfs_dir / doc['pdf_filename']
+            
+            # Only revalidate docs that have a cached copy to reuse
+            if self.cached and pdf_path.exists() and self.cache_meta_path(pdf_path).exists():
+                validators = await self.fetch_cache_validators(page, doc['url'])
+                if self.is_cache_fresh(doc, pdf_path, validators):
+                    print("Found in cache")
+                    self.record_completed_doc(doc)
+                    return True
             
-            # Navigate to the page
-            await page.goto(doc['url'], wait_until='networkidle')
+            # Navigate to the page; the main content selector below is the real readiness gate.
+            # DOMContentLoaded comes early, so a stuck navigation fails fast instead of after
+            # the 2 minute context default
+            response = await page.goto(
+                doc['url'],
+                wait_until=self.config.get('wait_until', 'domcontentloaded'),
+                timeout=NAVIGATION_TIMEOUT,
+            )
             
             # Wait for main content to load
             selectors = self.config.get('selectors', {})
             main_content_selector = selectors.get('main_content', 'article')
-            await page.wait_for_selector(main_content_selector, timeout=10000)
+            await page.locator(main_content_selector).first.wait_for(timeout=10000)
             
             # Handle site-specific content
             await self.site_handler.handle_site_specific_content(page)
@@ -103,17 +602,49 @@ class DocumentationScraper:
             # Add title page
             await self.add_title_page(page, doc, index)
             
-            # Apply site-specific CSS overrides with error handling
-            if hasattr(self.site_handler, 'get_css_overrides'):
-                css_overrides = self.site_handler.get_css_overrides()
-                await page.add_style_tag(content=css_overrides)
+            # Wait for fonts and one full layout pass so the styles have applied,
+            # but don't let a page that never settles stall the whole run
+            try:
+                await asyncio.wait_for(page.evaluate(READY_JS), timeout=READY_TIMEOUT)
+            except asyncio.TimeoutError:
+                print(f"Page did not settle within {READY_TIMEOUT}s, printing anyway")
+            
+            pdf_data = await self.emit_pdf(page)
             
-            # Wait for styles to apply
-            await asyncio.sleep(1)
+            # Hand the bytes straight to the merger, so it never reads them back from disk
+            self.pdf_data[doc['pdf_filename']] = pdf_data
             
-            # Generate PDF
-            await page.pdf(
-                path=str(self.individual_pdfs_dir / doc['pdf_filename']),
+            if self.keep_individual:
+                # Write the PDF and its cache metadata, then return once both are on disk;
+                # the page rendered fine, so a failed write only costs the saved copy
+                meta = self.build_cache_meta(doc, pdf_data, self.get_cache_validators(response))
+                try:
+                    await self.write_files([
+                        (pdf_path, pdf_data),
+                        (self.cache_meta_path(pdf_path), meta),
+                    ])
+                except Exception as e:
+                    print(f"Could not save {pdf_path.name}, merging it anyway: {e}")
+                else:
+                    self.record_completed_doc(doc)
+            
+            print(f"✓ Saved: {doc['title']}")
+            return True
+            
+        except Exception as e:
+            print(f"✗ Error processing {doc['url']}: {e}")
+            return False
+    
+    def record_completed_doc(self, doc):
+        """Record a doc whose PDF is on disk, so --resume can merge it from there"""
+        self.docs_manifest.write(json.dumps(doc) + "\n")
+        self.docs_manifest.flush()
+    
+    async def emit_pdf(self, page, prefer_css_page_size=True):
+        """Print an already prepared page to PDF and return the PDF bytes"""
+        # Other workers keep navigating while this one waits for an emit slot
+        async with self.pdf_semaphore:
+            return await page.pdf(
                 format='A4',
                 margin={
                     'top': '15mm',
@@ -122,259 +653,251 @@ class DocumentationScraper:
                     'right': '10mm'
                 },
                 print_background=True,
-                prefer_css_page_size=True,
+                prefer_css_page_size=prefer_css_page_size,
                 display_header_footer=True,
                 header_template='<div></div>', 
                 footer_template='<div></div>',
             )
+    
+    async def write_files(self, files):
+        """Queue (path, bytes) pairs for the background writer and wait until they are written"""
+        written = asyncio.get_running_loop().create_future()
+        await self.write_queue.put((files, written))
+        await written
+    
+    async def write_worker(self):
+        """Write queued files in batches until a None sentinel is received"""
+        while True:
+            item = await self.write_queue.get()
+            if item is None:
+                break
             
-            print(f"✓ Saved: {doc['title']}")
-            return True
+            # Take whatever else is already waiting, up to the batch size
+            batch = [item]
+            while len(batch) < self.write_batch and not self.write_queue.empty():
+                next_item = self.write_queue.get_nowait()
+                if next_item is None:
+                    self.write_queue.put_nowait(None)
+                    break
+                batch.append(next_item)
             
+            try:
+                await asyncio.to_thread(self.write_file_batch, [files for files, _ in batch])
+            except Exception as e:
+                for _, written in batch:
+                    written.set_exception(e)
+            else:
+                for _, written in batch:
+                    written.set_result(None)
+    
+    def write_file_batch(self, batch):
+        """Atomically write a batch of files, syncing each directory once at the end"""
+        directories = set()
+        for files in batch:
+            for path, data in files:
+                tmp_path = path.with_name(path.name + '.tmp')
+                tmp_path.write_bytes(data)
+                os.replace(tmp_path, path)
+                directories.add(path.parent)
+        
+        # Persist the renames with one directory fsync per batch (POSIX only)
+        if hasattr(os, 'O_DIRECTORY'):
+            for directory in directories:
+                fd = os.open(directory, os.O_RDONLY | os.O_DIRECTORY)
+                try:
+                    os.fsync(fd)
+                finally:
+                    os.close(fd)
+    
+    def get_cache_validators(self, response):
+        """Extract the HTTP cache validators from a response"""
+        headers = response.headers if response else {}
+        return {
+            'etag': headers.get('etag'),
+            'last_modified': headers.get('last-modified'),
+        }
+    
+    async def fetch_cache_validators(self, page, url):
+        """Fetch the current cache validators for a URL with a HEAD request"""
+        try:
+            response = await page.request.head(url)
         except Exception as e:
-            print(f"✗ Error processing {doc['url']}: {e}")
+            print(f"Could not revalidate {url}: {e}")
+            return None
+        
+        # A missing or failing page must be re-rendered, never served from cache
+        if not response.ok:
+            print(f"Could not revalidate {url}: HTTP {response.status}")
+            return None
+        return self.get_cache_validators(response)
+    
+    def is_cache_fresh(self, doc, pdf_path, validators):
+        """Check whether a previously rendered PDF can be reused"""
+        if validators is None:
+            return False
+        
+        meta = self.read_cache_meta(doc, pdf_path)
+        if meta is None:
+            return False
+        
+        if self.max_age is not None and time.time() - meta.get('timestamp', 0) >= self.max_age:
+            return False
+        
+        # Without any validator there is nothing to compare, so only an explicit
+        # --max-age (checked above) can vouch for the cached copy
+        if not any(validators.values()) and self.max_age is None:
+            return False
+        
+        # Only compare validators the server actually sends
+        for key, value in validators.items():
+            if value and value != meta.get(key):
+                return False
+        
+        return self.verify_pdf(pdf_path, meta)
+    
+    def read_cache_meta(self, doc, pdf_path):
+        """Cache metadata of a doc's PDF, or None if either is missing or it was rendered from another URL"""
+        meta_path = self.cache_meta_path(pdf_path)
+        if not pdf_path.exists() or not meta_path.exists():
+            return None
+        
+        try:
+            meta = json.loads(meta_path.read_text())
+        except ValueError:
+            return None
+        
+        return meta if meta.get('url') == doc['url'] else None
+    
+    def verify_pdf(self, pdf_path, meta):
+        """Check a PDF against the SHA-1 recorded in its cache metadata"""
+        # Guard against PDFs truncated or replaced since they were recorded
+        sha1 = hashlib.sha1(pdf_path.read_bytes()).hexdigest()
+        if sha1 != meta.get('sha1'):
             return False
+        
+        self.verified_sha1[pdf_path.name] = sha1
+        return True
+    
+    def cache_meta_path(self, pdf_path):
+        """Path of the cache metadata sidecar for a PDF"""
+        return pdf_path.with_name(pdf_path.name + '.meta.json')
+    
+    def build_cache_meta(self, doc, pdf_data, validators):
+        """Serialize the cache metadata sidecar for a freshly rendered PDF"""
+        meta = {
+            'timestamp': time.time(),
+            'url': doc['url'],
+            'sha1': hashlib.sha1(pdf_data).hexdigest(),
+            **validators,
+        }
+        return json.dumps(meta, indent=2).encode()
     
     async def add_title_page(self, page, doc, index):
         """Add a title page to the document"""
-        title_script = f"""
-            const titleDiv = document.createElement('div');
-            titleDiv.style.cssText = `
-                text-align: center;
-                padding: 50px 20px 20px 20px;
-                font-family: -apple-system, BlinkMacSystemFont, 'Segoe UI', Roboto, sans-serif;
-                border-bottom: 2px solid #0066cc;
-                margin-bottom: 30px;
-            `;
-            titleDiv.innerHTML = `
-                <h1 style="color: #0066cc; margin: 0; font-size: 2.5em;">
-                    {index + 1}. {doc['title']}
-                </h1>
-                <p style="color: #666; margin: 10px 0 0 0; font-size: 1.1em;">
-                    {doc['url']}
-                </p>
-            `;
-            
-            const article = document.querySelector('article');
-            if (article) {{
-                article.insertBefore(titleDiv, article.firstChild);
-            }}
-        """
-        await page.evaluate(title_script)
+        await page.evaluate("doc => window.__injectTitle(doc)", {
+            'number': index + 1,
+            'title': doc['title'],
+            'url': doc['url'],
+        })
     
     def create_table_of_contents(self):
         """Create a section-organized table of contents"""
         print("Creating section-organized table of contents...")
         
         site_name = self.config['site_name']
-        toc_title = self.site_handler.get_toc_title()
-        
-        html_content = f"""
-        <!DOCTYPE html>
-        <html>
-        <head>
-            <meta charset="utf-8">
-            <title>{toc_title} - Table of Contents</title>
-            <style>
-                body {{
-                    font-family: -apple-system, BlinkMacSystemFont, 'Segoe UI', Roboto, sans-serif;
-                    line-height: 1.6;
-                    max-width: 800px;
-                    margin: 0 auto;
-                    padding: 40px 20px;
-                    color: #333;
-                }}
-                
-                .header {{
-                    text-align: center;
-                    margin-bottom: 50px;
-                    border-bottom: 3px solid #0066cc;
-                    padding-bottom: 30px;
-                }}
-                
-                .header h1 {{
-                    color: #0066cc;
-                    font-size: 3em;
-                    margin: 0;
-                    font-weight: 300;
-                }}
-                
-                .header p {{
-                    color: #666;
-                    font-size: 1.2em;
-                    margin: 20px 0 0 0;
-                }}
-                
-                .section-header {{
-                    background: linear-gradient(135deg, #0066cc, #004499);
-                    color: white;
-                    padding: 15px 20px;
-                    margin: 30px 0 10px 0;
-                    border-radius: 8px;
-                    font-size: 1.3em;
-                    font-weight: 600;
-                    text-transform: uppercase;
-                    letter-spacing: 1px;
-                    page-break-inside: avoid;
-                    page-break-after: avoid;
-                }}
-                
-                .section-header:first-of-type {{
-                    margin-top: 0;
-                }}
-                
-                .toc-entry {{
-                    display: flex;
-                    justify-content: space-between;
-                    align-items: center;
-                    padding: 12px 20px;
-                    margin: 2px 0;
-                    border-left: 4px solid #e3f2fd;
-                    background-color: #fafafa;
-                    border-radius: 0 6px 6px 0;
-                    page-break-inside: avoid;
-                    transition: all 0.2s ease;
-                }}
-                
-                .toc-entry:hover {{
-                    background-color: #e3f2fd;
-                    border-left-color: #0066cc;
-                }}
-                
-                .toc-title {{
-                    flex-grow: 1;
-                    font-weight: 500;
-                    color: #0066cc;
-                    font-size: 1.05em;
-                }}
-                
-                .toc-page {{
-                    font-weight: bold;
-                    color: #666;
-                    margin-left: 20px;
-                    background-color: #0066cc;
-                    color: white;
-                    padding: 4px 8px;
-                    border-radius: 12px;
-                    font-size: 0.9em;
-                }}
-                
-                .toc-url {{
-                    font-size: 0.8em;
-                    color: #999;
-                    font-style: italic;
-                    margin-top: 4px;
-                    opacity: 0.8;
-                }}
-                
-                .generation-info {{
-                    margin-top: 50px;
-                    padding-top: 30px;
-                    border-top: 1px solid #eee;
-                    font-size: 0.9em;
-                    color: #666;
-                    text-align: center;
-                }}
-                
-                .section-summary {{
-                    background-color: #f8f9fa;
-                    padding: 15px;
-                    border-radius: 6px;
-                    margin: 20px 0;
-                    border-left: 4px solid #0066cc;
-                }}
-            </style>
-        </head>
-        <body>
-            <div class="header">
-                <h1>{toc_title}</h1>
-                <p>Complete Documentation Guide</p>
-            </div>
-            
-            <div class="toc">
-        """
+        toc_title = self.site_handler.toc_title
+        
+        parts = [TOC_HEADER_TEMPLATE.format(toc_title=html.escape(toc_title))]
         
         # Group PDFs by section
-        sections_dict = {}
+        sections_dict = defaultdict(list)
         for doc in self.doc_metadata:
-            section = doc['section']
-            if section not in sections_dict:
-                sections_dict[section] = []
-            sections_dict[section].append(doc)
+            sections_dict[doc['section']].append(doc)
+        
+        # Follow the handler's section order, appending any sections it didn't
+        # report so that none of their articles are dropped
+        ordered_sections = dict.fromkeys([*self.site_handler.sections, *sections_dict])
         
         article_counter = 1
-        for section in self.site_handler.sections:
-            if section in sections_dict:
-                docs = sections_dict[section]
-                
+        for section in ordered_sections:
+            docs = sections_dict.get(section)
+            if docs:
                 # Add section header
-                html_content += f"""
-                    <div class="section-header">{section}</div>
-                """
+                parts.append(TOC_SECTION_TEMPLATE.format(section=html.escape(section)))
                 
                 # Add articles in this section
                 for doc in docs:
-                    html_content += f"""
-                        <div class="toc-entry">
-                            <div>
-                                <div class="toc-title">{article_counter}. {doc['title']}</div>
-                                <div class="toc-url">{doc['url']}</div>
-                            </div>
-                        </div>
-                    """
+                    parts.append(TOC_ENTRY_TEMPLATE.format(
+                        number=article_counter,
+                        title=html.escape(doc['title']),
+                        url=html.escape(doc['url']),
+                    ))
                     article_counter += 1
         
         # Add summary information
         total_sections = len(self.site_handler.sections)
         total_articles = len(self.doc_metadata)
         
-        html_content += f"""
+        parts.append(f"""
             </div>
             
             <div class="section-summary">
                 <strong>Documentation Summary:</strong><br>
                 📚 {total_sections} sections covering {total_articles} articles<br>
-                🔗 Complete {site_name} documentation
+                🔗 Complete {html.escape(site_name)} documentation
             </div>
         </body>
         </html>
-        """
+        """)
         
-        return html_content
+        return "".join(parts)
     
-    async def create_toc_pdf(self, browser):
+    async def queue_toc_pdf(self):
+        """Create the table of contents PDF and hand it to the merger as the first document"""
+        toc_created = await self.create_toc_pdf()
+        await self.merge_queue.put((0, self.doc_metadata[0] if toc_created else None))
+    
+    async def create_toc_pdf(self):
         """Create table of contents as a separate PDF"""
         try:
             toc_html = self.create_table_of_contents()
-            toc_path = self.individual_pdfs_dir / "000_table_of_contents.pdf"
+            toc_doc = {
+                'title': 'Table of Contents',
+                'url': 'Table of Contents',
+                'pdf_filename': TOC_PDF_FILENAME,
+            }
+            toc_path = self.individual_pdfs_dir / TOC_PDF_FILENAME
             
-            # Create a new page for TOC
-            toc_page = await browser.new_page()
-            await toc_page.set_content(toc_html)
+            # The TOC is fully determined by its HTML, so a cached PDF rendered
+            # from the same HTML can be reused without opening the browser
+            toc_key = {'html_blake2b': hashlib.blake2b(toc_html.encode()).hexdigest()}
+            if self.cached and self.is_cache_fresh(toc_doc, toc_path, toc_key):
+                self.doc_metadata.insert(0, toc_doc)
+                print("✓ Table of contents unchanged, reusing cached PDF")
+                return True
             
-            await toc_page.pdf(
-                path=str(toc_path),
-                format='A4',
-                margin={
-                    'top': '15mm',
-                    'bottom': '15mm',
-                    'left': '10mm',
-                    'right': '10mm'
-                },
-                print_background=True,
-                display_header_footer=True,
-                header_template='<div></div>',
-                footer_template='<div></div>',
-            )
+            # Render on a pooled page; set_content replaces its document entirely
+            toc_page = await self.page_pool.get()
+            try:
+                await toc_page.set_content(toc_html)
+                
+                # The TOC has no @page rules of its own, so keep the A4 format
+                toc_data = await self.emit_pdf(toc_page, prefer_css_page_size=False)
+            finally:
+                self.page_pool.put_nowait(toc_page)
             
-            await toc_page.close()
+            self.pdf_data[TOC_PDF_FILENAME] = toc_data
+            if self.keep_individual:
+                try:
+                    await self.write_files([
+                        (toc_path, toc_data),
+                        (self.cache_meta_path(toc_path), self.build_cache_meta(toc_doc, toc_data, toc_key)),
+                    ])
+                except Exception as e:
+                    print(f"Could not save {toc_path.name}, merging it anyway: {e}")
             
             # Insert TOC at the beginning of our PDF list
-            self.doc_metadata.insert(0, {
-                'title': 'Table of Contents',
-                'url': 'Table of Contents',
-                'pdf_filename': "000_table_of_contents.pdf",
-            })
+            self.doc_metadata.insert(0, toc_doc)
             
             print("✓ Created table of contents")
             return True
@@ -383,44 +906,177 @@ class DocumentationScraper:
             print(f"✗ Error creating table of contents: {e}")
             return False
     
-    def merge_pdfs(self):
-        """Merge all individual PDFs into one master PDF"""
-        print(f"\nMerging {len(self.doc_metadata)} PDF files...")
+    async def merge_worker(self):
+        """Merge PDFs into one master PDF in document order as they are queued"""
+        print("\nMerging PDF files as they are created...")
         
         try:
-            writer = PdfWriter()
-            page_number = 0 
-            for index, doc in enumerate(self.doc_metadata):
-                pdf_path = self.individual_pdfs_dir / doc['pdf_filename']
-                if pdf_path.exists():
-                    reader = PdfReader(pdf_path)
-                    writer.append(reader)
-                    
-                    # Add a bookmark pointing to the first page of this file
-                    writer.add_outline_item(
-                        title=f"{index:03d} {doc['title']}",  # bookmark title
-                        page_number=page_number
-                    )
-                    page_number += len(reader.pages)
-                    print(f"Adding: {pdf_path.name}")
-                else:
-                    print(f"Warning: {pdf_path} not found, skipping...")
+            writer = new_pdf_writer()
+            pending = {}
+            next_position = 0
+            merged_count = 0
+            loop = asyncio.get_running_loop()
             
-            # Create the merged PDF
-            merged_pdf_name = self.site_handler.get_merged_pdf_name()
-            merged_pdf_path = self.output_dir / merged_pdf_name
-            # Save the merged PDF
-            with open(merged_pdf_path, "wb") as f:
-                writer.write(f)
+            # On cached re-runs, unchanged docs are spliced from the previous merged PDF
+            self.merge_manifest = []
+            self.merge_outline = []
+            self.merge_sources = []
+            self.previous_merge, self.previous_manifest = (
+                await asyncio.to_thread(self.load_previous_merge) if self.cached else (None, {})
+            )
             
-            print(f"\n✅ Successfully created merged PDF: {merged_pdf_path}")
-            print(f"📄 File size: {merged_pdf_path.stat().st_size / (1024*1024):.1f} MB")
+            # The writer lives on one dedicated thread, so appends never queue behind
+            # the disk writes sharing the default executor
+            with ThreadPoolExecutor(max_workers=os.cpu_count()) as parse_pool, \
+                    ThreadPoolExecutor(max_workers=1) as merge_thread:
+                while True:
+                    item = await self.merge_queue.get()
+                    if item is None:
+                        break
+                    
+                    # Start parsing right away, even if earlier PDFs are still rendering
+                    position, doc = item
+                    pending[position] = (doc, loop.run_in_executor(parse_pool, self.read_pdf, doc) if doc else None)
+                    
+                    # PDFs finish out of order, so merge only once all earlier ones have settled
+                    while next_position in pending:
+                        doc, source_future = pending.pop(next_position)
+                        source = await source_future if source_future else None
+                        if source is not None:
+                            await loop.run_in_executor(
+                                merge_thread, self.append_pdf, writer, next_position, doc, source
+                            )
+                            merged_count += 1
+                        next_position += 1
             
-            return merged_pdf_path
+                print(f"\nMerged {merged_count} PDF files")
+                return await loop.run_in_executor(merge_thread, self.write_merged_pdf, writer)
             
         except Exception as e:
             print(f"✗ Error merging PDFs: {e}")
             return None
+        
+        finally:
+            # Copied pages read their streams from the sources, so they only close after saving
+            for source_pdf in self.merge_sources:
+                close_pdf(source_pdf)
+            if self.previous_merge is not None:
+                close_pdf(self.previous_merge)
+    
+    def merge_manifest_path(self, merged_pdf_path):
+        """Path of the manifest describing which pages of the merged PDF came from which doc"""
+        return merged_pdf_path.with_suffix('.manifest.json')
+    
+    def load_previous_merge(self):
+        """Load the previous merged PDF and its manifest, or (None, {}) if they can't be trusted"""
+        merged_pdf_path = self.output_dir / self.site_handler.merged_pdf_name
+        manifest_path = self.merge_manifest_path(merged_pdf_path)
+        if not merged_pdf_path.exists() or not manifest_path.exists():
+            return None, {}
+        
+        try:
+            manifest = json.loads(manifest_path.read_text())
+            merged_data = merged_pdf_path.read_bytes()
+            if hashlib.sha1(merged_data).hexdigest() != manifest.get('sha1'):
+                return None, {}
+            
+            entries = {entry['filename']: entry for entry in manifest['documents']}
+            return open_pdf(merged_data), entries
+        except Exception as e:
+            print(f"Ignoring previous merged PDF: {e}")
+            return None, {}
+    
+    def read_pdf(self, doc):
+        """
+        Load a single PDF ahead of merging, or return None if it is missing
+        
+        Returns (pdf, page range or None for all pages, sha1). A PDF unchanged
+        since the previous merge is taken from that merge instead of being read
+        and parsed.
+        """
+        pdf_data = self.pdf_data.pop(doc['pdf_filename'], None)
+        if pdf_data is not None:
+            sha1 = hashlib.sha1(pdf_data).hexdigest()
+        else:
+            sha1 = self.verified_sha1.pop(doc['pdf_filename'], None)
+        
+        previous = self.previous_manifest.get(doc['pdf_filename'])
+        if self.previous_merge is not None and previous and previous['sha1'] == sha1:
+            page_start = previous['page_start']
+            return self.previous_merge, (page_start, page_start + previous['page_count']), sha1
+        
+        if pdf_data is None:
+            pdf_path = self.individual_pdfs_dir / doc['pdf_filename']
+            if not pdf_path.exists():
+                print(f"Warning: {pdf_path} not found, skipping...")
+                return None
+            pdf_data = pdf_path.read_bytes()
+            sha1 = hashlib.sha1(pdf_data).hexdigest()
+        
+        # Load the page tree here rather than on the merge thread
+        source_pdf = open_pdf(pdf_data)
+        len(source_pdf.pages)
+        return source_pdf, None, sha1
+    
+    def append_pdf(self, writer, index, doc, source):
+        """Append a loaded PDF to the merged document with a bookmark to its first page"""
+        source_pdf, pages, sha1 = source
+        page_number = len(writer.pages)
+        source_pages = source_pdf.pages if pages is None else source_pdf.pages[pages[0]:pages[1]]
+        if pikepdf:
+            writer.pages.extend(source_pages)
+        else:
+            for page in source_pages:
+                writer.add_page(page)
+        if source_pdf is not self.previous_merge:
+            self.merge_sources.append(source_pdf)
+        
+        # Add a bookmark pointing to the first page of this file
+        self.merge_outline.append((f"{index:03d} {doc['title']}", page_number))
+        
+        self.merge_manifest.append({
+            'filename': doc['pdf_filename'],
+            'sha1': sha1,
+            'page_start': page_number,
+            'page_count': len(writer.pages) - page_number,
+        })
+        print(f"Adding: {doc['pdf_filename']}" + (" (unchanged)" if pages else ""))
+    
+    def write_merged_pdf(self, writer):
+        """Write the merged PDF and its manifest to the output directory"""
+        merged_pdf_name = self.site_handler.merged_pdf_name
+        merged_pdf_path = self.output_dir / merged_pdf_name
+        
+        # Save the merged PDF through a large buffer so the multi-MB output goes out
+        # in big sequential writes; qpdf also linearizes it for page-at-a-time viewing
+        with open(merged_pdf_path, "wb", buffering=MERGED_PDF_BUFFER_SIZE) as f:
+            if pikepdf:
+                with writer.open_outline() as outline:
+                    outline.root.extend(pikepdf.OutlineItem(title, page) for title, page in self.merge_outline)
+                writer.save(f, linearize=True)
+            else:
+                for title, page in self.merge_outline:
+                    writer.add_outline_item(title, page)
+                writer.write(f)
+        
+        # Hash the output in chunks rather than reading it all back into memory
+        with open(merged_pdf_path, "rb", buffering=MERGED_PDF_BUFFER_SIZE) as f:
+            merged_sha1 = hashlib.file_digest(f, "sha1").hexdigest()
+        
+        manifest = {
+            'sha1': merged_sha1,
+            'documents': self.merge_manifest,
+        }
+        self.merge_manifest_path(merged_pdf_path).write_text(json.dumps(manifest, indent=2))
+        
+        print(f"\n✅ Successfully created merged PDF: {merged_pdf_path}")
+        print(f"📄 File size: {merged_pdf_path.stat().st_size / (1024*1024):.1f} MB")
+        
+        peak_rss = peak_rss_mb()
+        if peak_rss is not None:
+            print(f"📈 Peak memory: {peak_rss:.1f} MB")
+        
+        return merged_pdf_path
 
 
 async def main():
@@ -435,6 +1091,7 @@ Available sites:
 Examples:
   python doc_scraper.py --site react-native
   python doc_scraper.py --site react-native --output my_docs --cached
+  python doc_scraper.py --site react-native --concurrency 8
         """
     )
     
@@ -451,7 +1108,70 @@ Examples:
     parser.add_argument(
         "--cached",
         action="store_true",
-        help="Skip pages that already exist in cache"
+        help="Skip pages whose cached PDF is still fresh"
+    )
+    
+    parser.add_argument(
+        "--force-index",
+        action="store_true",
+        help="Rediscover the documentation URLs even when --cached could reuse the saved index"
+    )
+    
+    parser.add_argument(
+        "--keep-individual",
+        action="store_true",
+        help="Also save each page as a separate PDF (implied by --cached and --resume)"
+    )
+    
+    parser.add_argument(
+        "--resume",
+        action="store_true",
+        help="Skip pages an interrupted run already finished (implies --keep-individual)"
+    )
+    
+    parser.add_argument(
+        "--max-age",
+        type=float,
+        help="Maximum age in seconds of a cached PDF before it is re-rendered (default: no limit)"
+    )
+    
+    parser.add_argument(
+        "--concurrency", "-c",
+        type=int,
+        default=4,
+        help="Number of pages to scrape in parallel (default: 4)"
+    )
+    
+    parser.add_argument(
+        "--pdf-concurrency",
+        type=int,
+        default=4,
+        help="Maximum number of pages printed to PDF at the same time (default: 4)"
+    )
+    
+    parser.add_argument(
+        "--write-batch",
+        type=int,
+        default=8,
+        help="Maximum number of rendered PDFs written to disk per batch (default: 8)"
+    )
+    
+    parser.add_argument(
+        "--no-block-assets",
+        action="store_true",
+        help="Download images, fonts, media and trackers instead of blocking them, keeping an HTTP cache across runs"
+    )
+    
+    parser.add_argument(
+        "--clear-cache",
+        action="store_true",
+        help="Start from an empty browser cache instead of the one kept in the output directory (with --no-block-assets)"
+    )
+    
+    parser.add_argument(
+        "--verbose", "-v",
+        action="store_true",
+        help="Also show detailed site handler progress"
     )
     
     parser.add_argument(
@@ -462,6 +1182,15 @@ Examples:
     
     args = parser.parse_args()
     
+    # Site handlers report through logging; show it on stdout like the rest of the
+    # output, leaving the root logger (and third-party libraries) alone
+    handler_output = logging.StreamHandler(sys.stdout)
+    handler_output.setFormatter(logging.Formatter("%(message)s"))
+    handler_logger = logging.getLogger("site_handlers")
+    handler_logger.addHandler(handler_output)
+    handler_logger.setLevel(logging.DEBUG if args.verbose else logging.INFO)
+    handler_logger.propagate = False
+    
     if args.list_sites:
         print("Available documentation sites:")
         for site in list_available_sites():
@@ -474,10 +1203,13 @@ Examples:
     try:
         # Check dependencies
         from playwright.async_api import async_playwright
-        from PyPDF2 import PdfMerger
+        try:
+            import pikepdf
+        except ImportError:
+            import pypdf
     except ImportError as e:
         print("Please install required packages:")
-        print("pip install playwright PyPDF2")
+        print("pip install playwright pikepdf  # or pypdf instead of pikepdf")
         print("playwright install chromium")
         return
     
@@ -489,6 +1221,16 @@ Examples:
         # Create scraper
         scraper = DocumentationScraper(site_handler, args.output)
         scraper.cached = args.cached
+        scraper.max_age = args.max_age
+        scraper.force_index = args.force_index
+        scraper.block_assets = not args.no_block_assets
+        scraper.clear_cache = args.clear_cache
+        # The cache and resuming work from the individual PDFs, so both need them kept
+        scraper.keep_individual = args.keep_individual or args.cached or args.resume
+        scraper.resume = args.resume
+        scraper.concurrency = args.concurrency
+        scraper.pdf_concurrency = args.pdf_concurrency
+        scraper.write_batch = args.write_batch
         
         # Start scraping
         await scraper.scrape_all_docs()
@@ -502,4 +1244,11 @@ Examples:
 
 
 if __name__ == "__main__":
-    asyncio.run(main())
+    # Use the faster libuv-based event loop when it is installed
+    try:
+        import uvloop
+    except ImportError:
+        asyncio.run(main())
+    else:
+        with asyncio.Runner(loop_factory=uvloop.new_event_loop) as runner:
+            runner.run(main())
@@ -4,7 +4,28 @@ Defines the interface that all site-specific handlers must implement
 """
 
 from abc import ABC, abstractmethod
-from typing import List, Dict, Any
+from functools import cached_property, lru_cache
+from typing import AsyncIterator, List, Dict, Any
+from urllib.parse import urlparse
+import re
+
+
+# Filename cleaning, compiled once rather than per doc
+SLASH_TO_UNDERSCORE = str.maketrans('/', '_')
+# Maps every ASCII character outside [\w\-_.] to '_'; URL paths are
+# percent-encoded, so nothing beyond ASCII reaches it
+UNSAFE_TO_UNDERSCORE = str.maketrans({
+    c: '_' for c in map(chr, range(128)) if not re.match(r'[\w\-_.]', c)
+})
+
+
+@lru_cache(maxsize=4096)
+def path_to_filename(path: str) -> str:
+    """Turn a docs URL path into a clean filename stem"""
+    filename = path.removeprefix('/docs/').translate(SLASH_TO_UNDERSCORE).strip('_') or "getting_started"
+    
+    # Clean filename
+    return filename.translate(UNSAFE_TO_UNDERSCORE)
 
 
 class BaseSiteHandler(ABC):
@@ -14,8 +35,12 @@ class BaseSiteHandler(ABC):
         self.base_url = None
         self.docs_url = None
         self.site_name = None
+        # URL paths of the pages discovered so far
         self.visited_urls = set()
-        self.sections = []
+        # Section titles in sidebar order, as an insertion-ordered set
+        self.sections = {}
+        # Index of the next entry, which numbers its pdf_filename
+        self._entry_index = 0
     
     @abstractmethod
     async def get_all_doc_urls(self, page) -> List[Dict[str, Any]]:
@@ -23,7 +48,8 @@ class BaseSiteHandler(ABC):
         Extract all documentation URLs from the site
         
         Args:
-            page: Playwright page object
+            page: Playwright page object; may be a pooled page that has already
+                shown other documents, and is left open afterwards
             
         Returns:
             List of dictionaries containing:
@@ -34,6 +60,60 @@ class BaseSiteHandler(ABC):
         """
         pass
     
+    def reset_state(self):
+        """Forget the URLs, sections and numbering of a previous discovery"""
+        self.visited_urls.clear()
+        self.sections.clear()
+        self._entry_index = 0
+    
+    def restore_state(self, sections: List[str], docs: List[Dict[str, Any]]):
+        """
+        Rebuild the state a discovery would have left, from its saved results
+        
+        Args:
+            sections: Section titles in sidebar order
+            docs: The entries that discovery returned
+        """
+        self.sections = dict.fromkeys(sections)
+        self.visited_urls = {self._url_key(doc['url']) for doc in docs}
+        self._entry_index = len(docs)
+    
+    def _url_key(self, url: str) -> str:
+        """Key identifying a documentation page in visited_urls"""
+        return urlparse(url).path
+    
+    async def run_with_context(self, context) -> List[Dict[str, Any]]:
+        """
+        Run a fresh discovery on a new page of an existing browser context
+        Lets one handler instance be reused across runs on the same warm context
+        
+        Args:
+            context: Playwright BrowserContext to open the page in
+            
+        Returns:
+            The get_all_doc_urls entries
+        """
+        self.reset_state()
+        page = await context.new_page()
+        try:
+            return await self.get_all_doc_urls(page)
+        finally:
+            await page.close()
+    
+    async def iter_doc_urls(self, page) -> AsyncIterator[Dict[str, Any]]:
+        """
+        Yield documentation URL entries as they are discovered
+        Can be overridden by handlers that find pages incrementally
+        
+        Args:
+            page: Playwright page object
+            
+        Yields:
+            Dictionaries shaped like the get_all_doc_urls entries
+        """
+        for doc in await self.get_all_doc_urls(page):
+            yield doc
+    
     @abstractmethod
     def get_site_config(self) -> Dict[str, Any]:
         """
@@ -45,6 +125,7 @@ class BaseSiteHandler(ABC):
             - docs_url: Starting URL for documentation
             - site_name: Human-readable site name
             - selectors: Site-specific CSS selectors
+            - wait_until: Optional page.goto load state (default 'domcontentloaded')
         """
         pass
     
@@ -59,8 +140,7 @@ class BaseSiteHandler(ABC):
         """
         pass
     
-    @abstractmethod
-    async def generate_file_entry(self, url: str, title: str, section: str) -> Dict[str, Any]:
+    def generate_file_entry(self, url: str, title: str, section: str) -> Dict[str, Any]:
         """
         Generate file entry for an article page
         
@@ -69,9 +149,42 @@ class BaseSiteHandler(ABC):
             - url: Full URL to the documentation page
             - title: Page title
             - section: Section name the page belongs to
+            - filename: Clean filename stem derived from the URL
             - pdf_filename: Generated filename for the PDF
         """
-        pass
+        filename = self._post_clean_filename(path_to_filename(urlparse(url).path))
+
+        index = self._entry_index
+        self._entry_index += 1
+        pdf_filename = f"{index:03d}_{filename}.pdf"
+        
+        return {
+            'title': title or filename.replace('_', ' ').title(),
+            'url': url,
+            'section': section,
+            'filename': filename,
+            'pdf_filename': pdf_filename,
+        }
+    
+    def _post_clean_filename(self, filename: str) -> str:
+        """
+        Apply handler-specific cleanup to a generated filename stem
+        Can be overridden by specific handlers
+        
+        Returns:
+            Filename stem
+        """
+        return filename
+    
+    def get_blocked_resource_types(self) -> List[str]:
+        """
+        Get the Playwright resource types to abort while scraping
+        Can be overridden by handlers whose docs rely on e.g. images
+        
+        Returns:
+            List of resource types (see Request.resource_type)
+        """
+        return ['image', 'media', 'font']
     
     def get_toc_title(self) -> str:
         """
@@ -94,4 +207,13 @@ class BaseSiteHandler(ABC):
         site_clean = self.site_name.replace(' ', '_')
         return f"{site_clean}_Documentation.pdf"
     
+    @cached_property
+    def toc_title(self) -> str:
+        """Title for the table of contents, computed once per handler"""
+        return self.get_toc_title()
+    
+    @cached_property
+    def merged_pdf_name(self) -> str:
+        """Filename for the merged PDF, computed once per handler"""
+        return self.get_merged_pdf_name()
     
\ No newline at end of file
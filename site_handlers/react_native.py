@@ -3,11 +3,174 @@ React Native Documentation Site Handler
 Handles scraping of React Native documentation from reactnative.dev
 """
 
-import asyncio
-from typing import List, Dict, Any
-from urllib.parse import urljoin, urlparse
+import logging
+from typing import AsyncIterator, List, Dict, Any
 from .base_handler import BaseSiteHandler
-import re
+
+
+logger = logging.getLogger(__name__)
+
+# Longest wait in milliseconds for a clicked tab to become selected
+TAB_SWITCH_TIMEOUT = 1000
+
+# Number of expansion passes over the sidebar
+EXPAND_PASSES = 2
+
+# Longest wait in milliseconds for clicked sidebar categories to open
+EXPAND_TIMEOUT = 5000
+
+# Docusaurus sidebar selectors, baked into the discovery scripts below
+SIDEBAR_SELECTOR = '.menu__list'
+SIDEBAR_SECTION_SELECTOR = '.theme-doc-sidebar-item-category-level-1'
+SIDEBAR_SECTION_TITLE_SELECTOR = ':scope > .menu__list-item-collapsible a'
+SIDEBAR_LINK_SELECTOR = ':scope > ul .menu__list-item > a'
+COLLAPSED_CATEGORY_LINK_SELECTOR = '.menu__list-item--collapsed .menu__list-item-collapsible a'
+
+# Clicks all collapsed sidebar categories at once, then resolves when every one
+# of them has opened (or EXPAND_TIMEOUT has passed) with the numbers of
+# categories clicked and still collapsed
+EXPAND_SECTIONS_JS = """
+async () => {
+    const items = Array.from(
+        document.querySelectorAll('%(collapsed_link)s'),
+        link => {
+            link.click();
+            return link.closest('.menu__list-item');
+        }
+    );
+    const isOpen = item => !item.classList.contains('menu__list-item--collapsed');
+    await Promise.all(items.map(item => new Promise(resolve => {
+        if (isOpen(item)) {
+            return resolve();
+        }
+        const observer = new MutationObserver(() => {
+            if (isOpen(item)) {
+                observer.disconnect();
+                resolve();
+            }
+        });
+        observer.observe(item, { attributes: true, attributeFilter: ['class'] });
+        setTimeout(() => { observer.disconnect(); resolve(); }, %(timeout)d);
+    })));
+    return { clicked: items.length, collapsed: items.filter(item => !isOpen(item)).length };
+}
+""" % {'collapsed_link': COLLAPSED_CATEGORY_LINK_SELECTOR, 'timeout': EXPAND_TIMEOUT}
+
+# Walks the expanded sidebar and returns every level-1 section with its doc links,
+# already resolved to absolute URLs by the browser
+EXTRACT_SECTIONS_JS = """
+() => Array.from(document.querySelectorAll('%(section)s'), section => ({
+    title: section.querySelector('%(title)s')?.textContent ?? '',
+    links: Array.from(section.querySelectorAll('%(link)s'))
+        .filter(link => link.getAttribute('href') && link.href.includes('/docs/'))
+        .map(link => ({ href: link.href, title: link.textContent })),
+}))
+""" % {
+    'section': SIDEBAR_SECTION_SELECTOR,
+    'title': SIDEBAR_SECTION_TITLE_SELECTOR,
+    'link': SIDEBAR_LINK_SELECTOR,
+}
+
+# To load the default tab of every visible tab group, clicks its neighbor and
+# then the default tab again, each time waiting for React to mark the tab
+# selected; also opens every visible info box. Returns the number of tab groups
+# left on another tab
+ACTIVATE_CONTENT_JS = """
+async () => {
+    // Same test as Playwright's is_visible() (a non-empty box and not visibility:hidden),
+    // done without a round-trip per element
+    const isVisible = el => {
+        const rect = el.getBoundingClientRect();
+        return rect.width > 0 && rect.height > 0 && getComputedStyle(el).visibility !== 'hidden';
+    };
+    const isSelected = tab => tab.getAttribute('aria-selected') === 'true';
+    const whenSelected = tab => new Promise(resolve => {
+        if (isSelected(tab)) {
+            return resolve(true);
+        }
+        const observer = new MutationObserver(() => {
+            if (isSelected(tab)) {
+                observer.disconnect();
+                resolve(true);
+            }
+        });
+        observer.observe(tab, { attributes: true, attributeFilter: ['aria-selected'] });
+        setTimeout(() => { observer.disconnect(); resolve(isSelected(tab)); }, %d);
+    });
+
+    let unsettled = 0;
+
+    for (const tablist of document.querySelectorAll('[role="tablist"]')) {
+        const active = tablist.querySelector('[role="tab"][aria-selected="true"]');
+        const neighbor = tablist.querySelector('[role="tab"][aria-selected="false"]');
+        if (active && neighbor && isVisible(active)) {
+            neighbor.click();
+            await whenSelected(neighbor);
+            active.click();
+            if (!await whenSelected(active)) {
+                unsettled++;
+            }
+        }
+    }
+    document.querySelectorAll('.alert--info summary').forEach(summary => {
+        if (isVisible(summary)) {
+            summary.click();
+        }
+    });
+    return unsettled;
+}
+""" % TAB_SWITCH_TIMEOUT
+
+# Print stylesheet for the PDFs, shared by every page
+CSS_OVERRIDES = """
+    nav, .navbar, .menu, header, footer, 
+    .sidebar, .ad, .advertisement, .docsRating, 
+    .social-share, .edit-page-link, .theme-back-to-top-button,
+    .pagination-nav, .theme-toggle,
+    .navbar__sidebar, .docusaurus-highlight-code-line {
+        display: none !important;
+    }
+    
+    body {
+        font-size: 15px;
+    }
+    .main-wrapper {
+        padding-left: 0 !important;
+    }
+    
+    .container {
+        max-width: none !important;
+    }
+    
+    article {
+        max-width: 100% !important;
+        margin: 0 !important;
+    }
+    
+    pre {
+        overflow: hidden !important;
+        word-wrap: break-word !important;
+        font-size: 0.85em !important;
+        line-height: 1.3 !important;
+    }
+    
+    code {
+        word-wrap: break-word !important;
+        font-size: 0.9em !important;
+    }
+    
+    /* Better table formatting */
+    table {
+        font-size: 0.9em !important;
+        width: 100% !important;
+    }
+    
+    /* Ensure images fit properly */
+    img {
+        max-width: 100% !important;
+        height: auto !important;
+    }
+"""
 
 
 class ReactNativeHandler(BaseSiteHandler):
@@ -32,159 +195,86 @@ class ReactNativeHandler(BaseSiteHandler):
     
     async def get_all_doc_urls(self, page) -> List[Dict[str, Any]]:
         """Extract all React Native documentation URLs"""
-        print("Extracting all React Native documentation URLs...")
+        return [doc async for doc in self.iter_doc_urls(page)]
+    
+    async def iter_doc_urls(self, page) -> AsyncIterator[Dict[str, Any]]:
+        """Yield React Native documentation URLs as they are extracted"""
+        logger.info("Extracting all React Native documentation URLs...")
         
-        await page.goto(self.docs_url)
-        await page.wait_for_load_state('networkidle')
+        # The sidebar wait below is the real readiness signal; network idle may never
+        # come on pages with analytics beacons
+        await page.goto(self.docs_url, wait_until='domcontentloaded')
         
         # Wait for sidebar to load
         try:
-            await page.wait_for_selector('.menu__list', timeout=10000)
+            await page.locator(SIDEBAR_SELECTOR).first.wait_for(timeout=10000)
         except Exception as e:
-            print(f"Error waiting for sidebar: {e}")
-            return []
+            logger.warning("Error waiting for sidebar: %s", e)
+            return
         
         # First, expand all collapsible menu sections
-        print("Expanding collapsible menu sections...")
+        logger.debug("Expanding collapsible menu sections...")
         
-        iterationCount = 0
-        while iterationCount < 2:
-            collapsible_items = await page.query_selector_all('.menu__list-item--collapsed .menu__list-item-collapsible a')
-            print(f"Found {len(collapsible_items)} collapsible sections in iteration {iterationCount+1}")
-            for i, item in enumerate(collapsible_items):
-                try:
-                    # Click to expand the section
-                    await item.click()
-                    # Wait a bit for the content to load
-                    await asyncio.sleep(0.3)
-                    
-                except Exception as e:
-                    print(f"Error expanding section {i+1}: {e}")
-                    continue
+        for iteration in range(EXPAND_PASSES):
+            # Click and wait for every collapsed category in one round-trip; nested
+            # categories only appear once their parent is open, hence the extra pass
+            try:
+                expanded = await page.evaluate(EXPAND_SECTIONS_JS)
+            except Exception as e:
+                logger.warning("Error expanding sections: %s", e)
+                break
             
-            iterationCount += 1
+            logger.debug("Found %d collapsible sections in iteration %d", expanded['clicked'], iteration + 1)
+            if not expanded['clicked']:
+                break
+            if expanded['collapsed']:
+                logger.warning("Error expanding sections: %d still collapsed", expanded['collapsed'])
 
-        # Wait for all expansions to complete
-        await asyncio.sleep(1)
-        print("All sections expanded, now extracting URLs...")
+        logger.debug("All sections expanded, now extracting URLs...")
         
-        doc_metadata = []
-        # Get all links for each section in sidebar
-        sections = await page.query_selector_all('.theme-doc-sidebar-item-category-level-1')
+        # Get all links for each section in sidebar in a single round-trip
+        try:
+            sections = await page.evaluate(EXTRACT_SECTIONS_JS)
+        except Exception as e:
+            logger.warning("Error reading sidebar: %s", e)
+            return
+        
+        # The whole sidebar is already in hand, so keep the first (URL, title, section)
+        # of each new page in sidebar order and build the entries in one pass. Pages
+        # are keyed by path, so links differing only by query or fragment collapse
+        self.sections.update(dict.fromkeys(section['title'] for section in sections))
+        links = {}
         for section in sections:
-            section_title = await (await section.query_selector('> .menu__list-item-collapsible a')).text_content()
-            self.sections.append(section_title)
-
-            sidebar_links = await section.query_selector_all('> ul .menu__list-item > a')
-            for link in sidebar_links:
-                try:
-                    href = await link.get_attribute('href')
-                    page_title = await link.text_content()
-                    if href and '/docs/' in href and href not in self.visited_urls:
-                        if href.startswith('/'):
-                            href = urljoin(self.base_url, href)
-                        self.visited_urls.add(href)
-
-                        doc = await self.generate_file_entry(href, page_title, section_title)                        
-                        doc_metadata.append(doc)
-                except Exception as e:
-                    print(f"Error processing section: {e}")
-                    continue
+            for link in section['links']:
+                path = self._url_key(link['href'])
+                if path not in self.visited_urls:
+                    links.setdefault(path, (link['href'], link['title'], section['title']))
+        self.visited_urls.update(links)
+        
+        doc_metadata = [
+            self.generate_file_entry(href, title, section_title)
+            for href, title, section_title in links.values()
+        ]
+        for doc in doc_metadata:
+            yield doc
         
-        print(f"Found {len(doc_metadata)} documentation URLs across {len(self.sections)} sections")
-        return doc_metadata
+        logger.info("Found %d documentation URLs across %d sections", len(doc_metadata), len(self.sections))
     
     async def handle_site_specific_content(self, page):
         """Handle React Native specific content (tabs, info boxes, etc.)"""
         try:
-            try:
-                tablists = await page.query_selector_all('[role="tablist"]')
-                for tablist in tablists:
-                    try:
-                        # To load the default tab, first click its neighbor & then click the default tab again
-                        active_button = await tablist.query_selector('[role="tab"][aria-selected="true"]')
-                        neighbor_button = await tablist.query_selector('[role="tab"][aria-selected="false"]')
-                        isVisible = await active_button.is_visible()
-                        if isVisible:
-                            await neighbor_button.click()
-                            await asyncio.sleep(0.1)  # Wait for tab activation
-                            await active_button.click()                        
-                            await asyncio.sleep(0.1)  # Wait for tab activation
-                    except Exception as e:
-                        print(f"Error clicking tab: {e}")
-                        continue
-                
-                infoBoxes = await page.query_selector_all('.alert--info summary')
-                for box in infoBoxes:
-                    try:
-                        isVisible = await box.is_visible()
-                        if isVisible:
-                            await box.click()
-                    except Exception as e:
-                        print(f"Error clicking tab: {e}")
-                        continue
-                        
-            except Exception as e:
-                print(f"Error handling interactive elements: {e}")
-            
-            # Wait for content to load after changes
-            await asyncio.sleep(1)
-            
+            # All DOM work happens in one round-trip, which resolves once every tab
+            # switch has actually been applied; info boxes open synchronously
+            unsettled = await page.evaluate(ACTIVATE_CONTENT_JS)
+            if unsettled:
+                logger.debug("%d tab groups did not return to their default tab", unsettled)
             
         except Exception as e:
-            print(f"Error handling React Native specific content: {e}")
+            logger.warning("Error handling React Native specific content: %s", e)
     
     def get_css_overrides(self) -> str:
         """Get React Native specific CSS overrides for PDF generation"""
-        return """
-            nav, .navbar, .menu, header, footer, 
-            .sidebar, .ad, .advertisement, .docsRating, 
-            .social-share, .edit-page-link, .theme-back-to-top-button,
-            .pagination-nav, .theme-toggle,
-            .navbar__sidebar, .docusaurus-highlight-code-line {
-                display: none !important;
-            }
-            
-            body {
-                font-size: 15px;
-            }
-            .main-wrapper {
-                padding-left: 0 !important;
-            }
-            
-            .container {
-                max-width: none !important;
-            }
-            
-            article {
-                max-width: 100% !important;
-                margin: 0 !important;
-            }
-            
-            pre {
-                overflow: hidden !important;
-                word-wrap: break-word !important;
-                font-size: 0.85em !important;
-                line-height: 1.3 !important;
-            }
-            
-            code {
-                word-wrap: break-word !important;
-                font-size: 0.9em !important;
-            }
-            
-            /* Better table formatting */
-            table {
-                font-size: 0.9em !important;
-                width: 100% !important;
-            }
-            
-            /* Ensure images fit properly */
-            img {
-                max-width: 100% !important;
-                height: auto !important;
-            }
-        """
+        return CSS_OVERRIDES
     
     def get_toc_title(self) -> str:
         """Get React Native specific TOC title"""
@@ -194,25 +284,8 @@ class ReactNativeHandler(BaseSiteHandler):
         """Get React Native specific merged PDF name"""
         return "React_Native_Documentation.pdf"
 
-    async def generate_file_entry(self, url: str, title: str, section: str) -> Dict[str, Any]:
-        """Generate a clean filename from URL"""
-        path = urlparse(url).path
-
-        filename = path.replace('/docs/', '').replace('/', '_').strip('_')
-        if not filename:
-            filename = "getting_started"
-        
-        # Clean filename
-        filename = re.sub(r'[^\w\-_.]', '_', filename)
-        filename = re.sub(r'_+', '_', filename)  # Remove multiple underscores
-
-        index = len(self.visited_urls) - 1
-        pdf_filename = f"{index:03d}_{filename}.pdf"
-        
-        return {
-            'title': title or filename.replace('_', ' ').title(),
-            'url': url,
-            'section': section,
-            'pdf_filename': pdf_filename,
-        }
-    
\ No newline at end of file
+    def _post_clean_filename(self, filename: str) -> str:
+        """Remove multiple underscores from React Native filenames"""
+        while '__' in filename:
+            filename = filename.replace('__', '_')
+        return filename